@@ -21,5 +21,8 @@ setup(
             'wallquote=wallquote.main:main'
         ]
     },
-    install_requires=['Pillow', 'argparse']
+    install_requires=['Pillow', 'argparse'],
+    extras_require={
+        'stream': ['ijson']
+    }
 )
\ No newline at end of file
@@ -1,6 +1,5 @@
 import argparse
 import random
-from PIL import Image, ImageDraw, ImageFont
 import os
 import json
 import shutil
@@ -8,7 +7,8 @@ import ctypes
 from datetime import datetime
 import pathlib
 import textwrap
-import requests
+import functools
+import collections
 import sys
 import subprocess
 
@@ -16,6 +16,30 @@ CWD = pathlib.Path(__file__).parent
 QUOTE_FILE = os.path.join(CWD, "quotes.json")
 BACKGROUND_DIR = os.path.join(CWD, "bg_templates/")
 OUTPUT_DIR = os.path.join(CWD, "saved_bg_pics/")
+# File extensions (lowercase) accepted as background templates.
+_IMG_EXTS = frozenset({".png", ".jpg", ".jpeg"})
+
+# Parsed contents of QUOTE_FILE, keyed by its (mtime_ns, size) at parse time.
+_QUOTES_CACHE = {"key": None, "data": None}
+
+# Quote files larger than this are stream-parsed when only their tail is needed.
+STREAM_QUOTES_THRESHOLD = 512 * 1024
+
+# Shared HTTP session for the quote API, created on first use.
+QUOTE_API_URL = "https://stoic.tekloon.net/stoic-quote"
+QUOTE_API_TIMEOUT = (3.0, 5.0)
+_SESSION = None
+
+# Directories already created (or found to exist) during this process.
+_DIRS_READY = set()
+
+_RANDOM_BG_COLORS = (
+    (234, 231, 226), (215, 226, 232), (185, 203, 217), 
+    (252, 201, 197), (254, 221, 216), (207, 227, 226)
+)
+
+# Screen (width, height), queried from user32 on first use.
+_SCREEN = None
 
 
 def load_quotes():
@@ -26,16 +50,83 @@ def load_quotes():
     a list. If the file does not exist or is empty, it returns an empty list.
     If there is an error decoding the JSON, it also returns an empty list.
 
+    The parsed list is cached and only re-read when the file's modification
+    time or size changes. The returned list is a copy, but the quote dicts in
+    it are shared with the cache and must not be modified in place.
+
     Returns:
         list: A list of quotes loaded from the JSON file.
     """
-    if not os.path.exists(QUOTE_FILE):
+    try:
+        st = os.stat(QUOTE_FILE)
+    except FileNotFoundError:
         return []
-    with open(QUOTE_FILE, "r") as file:
-        try:
-            return json.load(file)
-        except json.JSONDecodeError:
-            return []
+    key = (st.st_mtime_ns, st.st_size)
+    if _QUOTES_CACHE["key"] != key:
+        with open(QUOTE_FILE, "r") as file:
+            try:
+                data = json.load(file)
+            except json.JSONDecodeError:
+                data = []
+        _QUOTES_CACHE["key"], _QUOTES_CACHE["data"] = key, data
+    return _QUOTES_CACHE["data"].copy()
+
+def _write_quotes(quotes):
+    """
+    Writes the given quotes to the quotes.json file and refreshes the cache.
+
+    Args:
+        quotes (list): The quotes to be written.
+
+    Returns:
+        None
+    """
+    with open(QUOTE_FILE, "wb", buffering=65536) as file:
+        file.write(json.dumps(quotes, separators=(",", ":")).encode("utf-8"))
+    st = os.stat(QUOTE_FILE)
+    _QUOTES_CACHE["key"], _QUOTES_CACHE["data"] = (st.st_mtime_ns, st.st_size), quotes.copy()
+
+def _ensure_dir(path):
+    """
+    Creates the given directory if needed, at most once per process.
+
+    Args:
+        path (str): The directory to create.
+    """
+    if path in _DIRS_READY:
+        return
+    os.makedirs(path, exist_ok=True)
+    _DIRS_READY.add(path)
+
+def _screen():
+    """
+    Returns the primary screen resolution, querying Windows only once per process.
+
+    Returns:
+        tuple: The (width, height) of the screen in pixels.
+    """
+    global _SCREEN
+    if _SCREEN is None:
+        user32 = ctypes.windll.user32
+        _SCREEN = (user32.GetSystemMetrics(0), user32.GetSystemMetrics(1))
+    return _SCREEN
+
+def _get_session():
+    """
+    Returns the shared requests session for the quote API, creating it on first use.
+
+    Retries are disabled so that a failing API falls back to local quotes quickly.
+
+    Returns:
+        requests.Session: The shared session.
+    """
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        _SESSION = requests.Session()
+        _SESSION.mount("https://", HTTPAdapter(max_retries=0))
+    return _SESSION
 
 def save_quote(quote, author=None):
     """
@@ -46,36 +137,35 @@ def save_quote(quote, author=None):
         author (str, optional): The author of the quote. Defaults to None.
 
     Returns:
-        None
+        list: The quotes after the new one has been added.
     """
     quotes = load_quotes()
     if author:
         quotes.append({"id": len(quotes) + 1, "quote": quote, "author": author})
     else:
         quotes.append({"id": len(quotes) + 1, "quote": quote})
-    with open(QUOTE_FILE, "w") as file:
-        json.dump(quotes, file, indent=4)
+    _write_quotes(quotes)
+    return quotes
 
 def delete_quote(quote_id):
     """
     Deletes a quote with the given id from the quotes.json file.
 
+    The remaining quotes are renumbered from 1. If no quote has the given id,
+    the file is left untouched.
+
     Args:
         quote_id (int): The id of the quote to be deleted.
 
     Returns:
-        None
+        list: The quotes remaining after the deletion.
     """
     quotes = load_quotes()
-    out_quotes = []
-    id_counter = 1
-    for quote in quotes:
-        if quote.get("id") != quote_id:
-            quote["id"] = id_counter
-            out_quotes.append(quote)
-            id_counter += 1
-    with open(QUOTE_FILE, "w") as file:
-        json.dump(out_quotes, file, indent=4)
+    out_quotes = [{**quote, "id": i} for i, quote in enumerate((q for q in quotes if q.get("id") != quote_id), 1)]
+    if len(out_quotes) == len(quotes):
+        return quotes
+    _write_quotes(out_quotes)
+    return out_quotes
 
 def save_bg_image(image_path, save_dir=BACKGROUND_DIR):
     """
@@ -85,10 +175,11 @@ def save_bg_image(image_path, save_dir=BACKGROUND_DIR):
         image_path (str): The path to the background image file.
         save_dir (str, optional): The directory to save the background image in. Defaults to BACKGROUND_DIR (./saved_bg_pics).
     """
-    if not os.path.exists(image_path):
+    if not os.path.isfile(image_path):
         raise FileNotFoundError(f"Image not found at {image_path}")
-    os.makedirs(save_dir, exist_ok=True)
-    shutil.copy(image_path, save_dir)
+    _ensure_dir(save_dir)
+    # copyfile skips the permission copy and uses the platform's fast copy path.
+    shutil.copyfile(image_path, os.path.join(save_dir, os.path.basename(image_path)))
 
 def load_bg_image(image_path):
     """
@@ -104,13 +195,62 @@ def load_bg_image(image_path):
         FileNotFoundError: If the image file does not exist at the given path.
         Exception: If there is an error loading the image.
     """
-    if image_path is None or not os.path.exists(image_path):
+    from PIL import Image
+    if image_path is None:
         raise FileNotFoundError(f"Image not found at {image_path}")
     try:
         return Image.open(image_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Image not found at {image_path}") from None
     except Exception as e:
         raise Exception(f"Error loading image from {image_path}: {e}")
-    
+
+
+@functools.lru_cache(maxsize=32)
+def _get_font(size):
+    """
+    Returns the wallpaper font at the given size, parsing it at most once per process.
+
+    Falls back to Pillow's default font if arial.ttf cannot be found. On Pillow
+    versions before 10.1 that default font cannot be resized.
+
+    Args:
+        size (int): The font size in points.
+
+    Returns:
+        PIL.ImageFont.FreeTypeFont: The loaded font.
+    """
+    from PIL import ImageFont
+    try:
+        return ImageFont.truetype("arial.ttf", size)
+    except IOError:
+        try:
+            return ImageFont.load_default(size)
+        except TypeError:
+            # Pillow < 10.1 only provides a fixed-size bitmap default font.
+            return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=128)
+def _render_text_tile(text, size, fill=(255, 255, 255, 255)):
+    """
+    Renders text onto a transparent tile, rasterizing each (text, size, fill) at most once per process.
+
+    Args:
+        text (str): The text to render.
+        size (int): The font size in points.
+        fill (tuple, optional): The RGBA text color. Defaults to opaque white.
+
+    Returns:
+        tuple: The rendered RGBA tile and the (x, y) offset of the text's bounding box
+               relative to the drawing origin.
+    """
+    from PIL import Image, ImageDraw
+    font = _get_font(size)
+    bbox = font.getbbox(text)
+    tile = Image.new("RGBA", (bbox[2] - bbox[0] + 2, bbox[3] - bbox[1] + 2), (0, 0, 0, 0))
+    ImageDraw.Draw(tile).text((-bbox[0], -bbox[1]), text, font=font, fill=fill)
+    return tile, (bbox[0], bbox[1])
 
 
 def create_wallpaper(quote, author=None, bg_image=None, out_image_path=None):
@@ -131,61 +271,76 @@ def create_wallpaper(quote, author=None, bg_image=None, out_image_path=None):
     Returns:
         tuple: A tuple containing the path to the saved wallpaper image and the image object itself.
     """
+    from PIL import Image, ImageDraw
 
     max_width=800
     max_height=500
-    screen_width = ctypes.windll.user32.GetSystemMetrics(0)
-    screen_height = ctypes.windll.user32.GetSystemMetrics(1)
+    screen_width, screen_height = _screen()
     if bg_image is None:
-        random_bg_colors = [
-            (234, 231, 226), (215, 226, 232), (185, 203, 217), 
-            (252, 201, 197), (254, 221, 216), (207, 227, 226)
-        ]
-        bg_image = Image.new("RGB", (screen_width, screen_height), color=random.choice(random_bg_colors))
+        # Allocated directly in the final RGB mode; nothing below converts it again.
+        bg_image = Image.new("RGB", (screen_width, screen_height), color=random.choice(_RANDOM_BG_COLORS))
     else:   
-        bg_image = bg_image.resize((screen_width, screen_height))
+        # Bilinear is indistinguishable at mild scale factors; keep Lanczos for heavy downscaling.
+        ratio = min(screen_width / bg_image.width, screen_height / bg_image.height)
+        resample = Image.BILINEAR if ratio >= 0.5 else Image.LANCZOS
+        bg_image = bg_image.resize((screen_width, screen_height), resample=resample)
+        if bg_image.mode != "RGB":
+            bg_image = bg_image.convert("RGB")
     draw = ImageDraw.Draw(bg_image)
-    try:
-        font = ImageFont.truetype("arial.ttf", size=80)  
-    except IOError:
-        font = ImageFont.load_default()
     max_chars_per_line = 30 
     wrapped_text = textwrap.fill(quote, width=max_chars_per_line).capitalize()
     font_size = 80
-    while True:
-        font = ImageFont.truetype("arial.ttf", font_size)
-        bbox = draw.textbbox((0, 0), wrapped_text, font=font) 
-        text_width, text_height = bbox[2] - bbox[0], bbox[3] - bbox[1]
-        if text_width <= max_width and text_height <= max_height:
-            break
-        font_size -= 5 
+    bbox = draw.multiline_textbbox((0, 0), wrapped_text, font=_get_font(font_size)) 
+    if bbox[2] - bbox[0] > max_width or bbox[3] - bbox[1] > max_height:
+        # Binary search for the largest size in [8, 80) that fits, falling back to 8.
+        lo, hi = 8, font_size - 1
+        font_size, bbox = 8, None
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            mid_bbox = draw.multiline_textbbox((0, 0), wrapped_text, font=_get_font(mid))
+            if mid_bbox[2] - mid_bbox[0] <= max_width and mid_bbox[3] - mid_bbox[1] <= max_height:
+                font_size, bbox = mid, mid_bbox
+                lo = mid + 1
+            else:
+                hi = mid - 1
+        if bbox is None:
+            bbox = draw.multiline_textbbox((0, 0), wrapped_text, font=_get_font(font_size))
+    font = _get_font(font_size)
+    text_width, text_height = bbox[2] - bbox[0], bbox[3] - bbox[1]
     author_font_size = font_size // 2
-    author_font = ImageFont.truetype("arial.ttf", author_font_size) if author else None
+    author_font = _get_font(author_font_size) if author else None
     author_text = f"- {' '.join([word.capitalize() for word in author.split(' ')])}" if author else ""
     author_bbox = draw.textbbox((0, 0), author_text, font=author_font) if author else (0, 0, 0, 0)
     author_width, author_height = author_bbox[2] - author_bbox[0], author_bbox[3] - author_bbox[1]
     x = (screen_width - text_width) // 2
     y = (screen_height - (text_height + author_height + 40)) // 2  
-    overlay = Image.new("RGBA", bg_image.size, (0, 0, 0, 0))
-    overlay_draw = ImageDraw.Draw(overlay)
     rect_margin = 40  
     rect_x1, rect_y1 = x - rect_margin, y - rect_margin
     rect_x2, rect_y2 = x + text_width + rect_margin, y + text_height + author_height + rect_margin + 20  
-    overlay_draw.rectangle([rect_x1, rect_y1, rect_x2, rect_y2], fill=(0, 0, 0, 120)) 
-    bg_image = Image.alpha_composite(bg_image.convert("RGBA"), overlay)
-    draw = ImageDraw.Draw(bg_image)
+    # An "RGBA" draw on an RGB image blends the fill into just the rectangle's pixels.
+    ImageDraw.Draw(bg_image, "RGBA").rectangle([rect_x1, rect_y1, rect_x2, rect_y2], fill=(0, 0, 0, 120)) 
     draw.text((x, y), f"\"{wrapped_text}\"", font=font, fill="white", align="center")
     if author:
         author_x = rect_x2 - author_width - 20 
         author_y = rect_y2 - author_height - 20 
-        draw.text((author_x, author_y), author_text, font=author_font, fill="white", align="right")
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+        tile, (offset_x, offset_y) = _render_text_tile(author_text, author_font_size)
+        bg_image.paste(tile, (author_x + offset_x, author_y + offset_y), tile)
+    _ensure_dir(OUTPUT_DIR)
     if out_image_path is None or not os.path.exists(out_image_path):
-        out_image_path = pathlib.Path(os.path.join(OUTPUT_DIR, "current_wallpaper.jpg")).absolute().__str__()
+        out_image_path = os.path.abspath(os.path.join(OUTPUT_DIR, "current_wallpaper.jpg"))
     else:
-        out_image_path = pathlib.Path(os.path.join(out_image_path, "saved_wallpaper.jpg")).absolute().__str__()
-    bg_image = bg_image.convert("RGB")
-    bg_image.save(out_image_path)
+        out_image_path = os.path.abspath(os.path.join(out_image_path, "saved_wallpaper.jpg"))
+    # Hand the encoder a large-buffered file so its many small writes are coalesced.
+    # Encode into a temporary file first so a failed save never truncates an existing wallpaper.
+    tmp_image_path = out_image_path + ".tmp"
+    try:
+        with open(tmp_image_path, "wb", buffering=1 << 20) as file:
+            bg_image.save(file, format="JPEG", quality=90, optimize=False, progressive=False, subsampling=2)
+        os.replace(tmp_image_path, out_image_path)
+    except BaseException:
+        if os.path.exists(tmp_image_path):
+            os.remove(tmp_image_path)
+        raise
     return out_image_path, bg_image
 
 def set_wallpaper(image_path):
@@ -212,16 +367,24 @@ def choose_random_bg_template():
     Returns a random background template image path from the BACKGROUND_DIR.
     
     Returns:
-        str: The path to the random background template image.
+        str: The path to the random background template image, or None if there are none.
     """
-    images = [img for img in os.listdir(BACKGROUND_DIR) if img.endswith((".png", ".jpg", ".jpeg"))]
-    return os.path.join(BACKGROUND_DIR, random.choice(images)) if images else None
+    # Single-pass reservoir sampling (k=1) so no list of names is built.
+    pick = None
+    n = 0
+    with os.scandir(BACKGROUND_DIR) as it:
+        for entry in it:
+            if os.path.splitext(entry.name)[1].lower() in _IMG_EXTS and entry.is_file():
+                n += 1
+                if random.random() * n < 1:
+                    pick = entry.path
+    return pick
 
 def get_random_quote(from_online=False, daily_quote=False):
     try:
         if not from_online:
             raise Exception
-        data = requests.get("https://stoic.tekloon.net/stoic-quote").json()["data"]
+        data = _get_session().get(QUOTE_API_URL, timeout=QUOTE_API_TIMEOUT).json()["data"]
         quote, author = data["quote"], data["author"]
     except Exception as e:
         if daily_quote:
@@ -283,11 +446,57 @@ def get_random_quote_wallpaper(out_image_path=None, from_online=False):
     path, img = create_wallpaper(quote, author, bg_image=load_bg_image(template) if template else None, out_image_path=out_image_path)
     return path, img
 
-def show_quotes_list(num):
-    quotes = load_quotes()
+def _tail_quotes(num):
+    """
+    Stream-parses QUOTE_FILE and keeps only its last quotes, without loading the whole list.
+
+    Requires the optional ijson package.
+
+    Args:
+        num (int): The number of quotes to keep.
+
+    Returns:
+        collections.deque: The last num quotes, or None if streaming is not possible.
+    """
+    try:
+        import ijson
+    except ImportError:
+        return None
+    with open(QUOTE_FILE, "rb") as file:
+        try:
+            return collections.deque(ijson.items(file, "item"), maxlen=num)
+        except ijson.JSONError:
+            return None
+
+def show_quotes_list(num, quotes=None):
+    """
+    Prints the last num quotes from the quotes.json file.
+
+    Already cached quotes are used as-is. Otherwise, files larger than
+    STREAM_QUOTES_THRESHOLD are stream-parsed when ijson is installed, so only
+    the printed quotes are held in memory.
+
+    Args:
+        num (int): The number of quotes to print.
+        quotes (list, optional): Already loaded quotes to print instead of reading the file. Defaults to None.
+    """
+    if quotes is not None:
+        quotes = quotes[-num:]
+    elif num > 0:
+        try:
+            st = os.stat(QUOTE_FILE)
+        except FileNotFoundError:
+            st = None
+        if st is not None:
+            if _QUOTES_CACHE["key"] == (st.st_mtime_ns, st.st_size):
+                quotes = _QUOTES_CACHE["data"][-num:]
+            elif st.st_size > STREAM_QUOTES_THRESHOLD:
+                quotes = _tail_quotes(num)
+    if quotes is None:
+        quotes = load_quotes()[-num:]
     if len(quotes) == 0:
         print("No quotes found! Add some first.")
-    for quote in quotes[-num:]:
+    for quote in quotes:
         print(f"{quote.get('id')} - \"{quote.get('quote')}\" by \"{quote.get('author', 'Unknown')}\"")
 
 
@@ -390,11 +599,11 @@ def main():
             if args.delete < 0:
                 os.remove(QUOTE_FILE)
             else:
-                delete_quote(args.delete)
-                show_quotes_list(args.limit)
+                updated = delete_quote(args.delete)
+                show_quotes_list(args.limit, quotes=updated)
         elif args.insert:
-            save_quote(args.insert, args.author)
-            show_quotes_list(args.limit)
+            updated = save_quote(args.insert, args.author)
+            show_quotes_list(args.limit, quotes=updated)
         elif args.limit:
             show_quotes_list(args.limit)
     elif args.bg_template: